@@ -82,7 +82,7 @@ public class SpzToTileset
      * @param contentFileName The content file name
      * @throws IOException If an IO error occurs
      */
-    private static void createTileset(
+    static void createTileset(
         String spzFileName, String outputDirectory, String contentFileName) throws IOException
     {
         // Read the SPZ data and a GaussianCloud
@@ -0,0 +1,80 @@
+/*
+ * www.javagl.de - JSpz
+ *
+ * Copyright 2025 Marco Hutter - http://www.javagl.de
+ */
+package de.javagl.jspz.examples;
+
+import java.io.BufferedReader;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStreamReader;
+import java.io.PrintStream;
+import java.nio.charset.StandardCharsets;
+
+/**
+ * A long-running variant of {@link SpzToTileset} that reads conversion 
+ * jobs from standard input, so that the JVM startup cost only has to be
+ * paid once for many conversions.
+ * 
+ * Each input line consists of the input file name, the output directory
+ * and the content file name, separated by tabs, so the file names can 
+ * not contain tabs or line breaks. For each line, a single status line
+ * is written to standard output: <code>OK</code> if the 
+ * conversion succeeded, or <code>ERR</code> followed by a message if it
+ * failed. The server terminates when the input is closed.
+ * 
+ * Everything else that is written to <code>System.out</code> while
+ * processing the jobs is redirected to <code>System.err</code>, so that
+ * it can not be confused with the status lines.
+ */
+public class SpzToTilesetServer
+{
+    /**
+     * The entry point
+     * 
+     * @param args Not used
+     * @throws IOException If reading from standard input fails
+     */
+    public static void main(String[] args) throws IOException
+    {
+        BufferedReader reader = new BufferedReader(
+            new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        PrintStream out = new PrintStream(
+            new FileOutputStream(FileDescriptor.out), true, 
+            StandardCharsets.UTF_8.name());
+        System.setOut(System.err);
+        String line = null;
+        while ((line = reader.readLine()) != null)
+        {
+            if (line.isEmpty())
+            {
+                continue;
+            }
+            String tokens[] = line.split("\t", -1);
+            if (tokens.length < 2)
+            {
+                out.println("ERR Invalid job: " + line);
+                continue;
+            }
+            String spzFileName = tokens[0];
+            String outputDirectory = tokens[1];
+            String contentFileName = 
+                tokens.length > 2 && !tokens[2].isEmpty() ? 
+                tokens[2] : "content.glb";
+            try
+            {
+                SpzToTileset.createTileset(
+                    spzFileName, outputDirectory, contentFileName);
+                out.println("OK");
+            }
+            catch (Exception e)
+            {
+                String message = String.valueOf(e.getMessage());
+                out.println("ERR " + e.getClass().getSimpleName() + ": "
+                    + message.replace('\n', ' ').replace('\r', ' '));
+            }
+        }
+    }
+}
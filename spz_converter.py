@@ -5,12 +5,20 @@ Supports both command-line and GUI interfaces.
 """
 
 import argparse
+import asyncio
+import concurrent.futures
+import functools
+import glob
+import hashlib
 import os
 import subprocess
 import sys
 import shutil
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple
 
 try:
     import tkinter as tk
@@ -20,13 +28,496 @@ except ImportError:
     GUI_AVAILABLE = False
 
 
+# JVM options that reduce the startup time of short-lived Maven invocations
+MAVEN_STARTUP_OPTS = "-XX:TieredStopAtLevel=1 -XX:+UseSerialGC -Xshare:auto -Dmaven.artifact.threads=10 -Dhttp.keepAlive=true"
+
+
+def _maven_env() -> dict:
+    """
+    Create the environment for Maven invocations, with the startup options
+    appended to any MAVEN_OPTS that are already set.
+    """
+    env = os.environ.copy()
+    env["MAVEN_OPTS"] = (env.get("MAVEN_OPTS", "") + " " + MAVEN_STARTUP_OPTS).strip()
+    return env
+
+
+def _default_timeout(input_file: str) -> float:
+    """
+    Compute the default conversion timeout for the given input file:
+    2 seconds per MiB, but at least 5 minutes.
+    """
+    return max(300.0, os.path.getsize(input_file) / (1 << 20) * 2.0)
+
+
+@functools.lru_cache(maxsize=None)
+def _test_maven(mvn_cmd: Tuple[str, ...]) -> Tuple[bool, str]:
+    """
+    Test Maven with a simple command. The result is cached, so that the
+    JVM startup of 'mvn --version' is only paid once per process.
+    
+    Returns:
+        Tuple of (success, error_message)
+    """
+    try:
+        result = subprocess.run([*mvn_cmd, "--version"], env=_maven_env(),
+                              capture_output=True, text=True, timeout=30)
+        if result.returncode != 0:
+            return False, f"Maven test failed: {result.stderr}"
+    except Exception as e:
+        return False, f"Maven test failed: {e}"
+    return True, ""
+
+
+def _forward_lines(stream, log: Callable[[str], None]):
+    """Pass each line of the given text stream to the log function, until the stream ends."""
+    for line in stream:
+        log(line.rstrip("\n"))
+
+
+def _parse_status(status: str) -> Optional[str]:
+    """
+    Parse a status line of the worker.
+    
+    Returns:
+        None if the job succeeded, or the error message otherwise
+    """
+    if status == "OK":
+        return None
+    if status.startswith("ERR "):
+        return status[4:]
+    return f"Unexpected worker output: {status}"
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command line argument that must be a positive integer."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, but is {number}")
+    return number
+
+
+def _spz_files(paths: Iterable[Path]) -> List[Path]:
+    """
+    Return the SPZ files among the given paths, sorted. The suffix is
+    compared case-insensitively, like in the input check of a single file.
+    """
+    return sorted(f for f in paths if f.suffix.lower() == ".spz" and f.is_file())
+
+
+def _batch_jobs(input_files: Sequence[Path], base_dir: Path, output_dir: str,
+                content_filename: str) -> List[Tuple[str, str, str]]:
+    """
+    Create the conversion jobs for the given input files. Each file is
+    converted into a directory that is named after the file, and placed
+    at the same position relative to output_dir as the file relative to
+    base_dir.
+    """
+    return [(str(f), str(Path(output_dir) / f.relative_to(base_dir).with_suffix("")), content_filename)
+            for f in input_files]
+
+
 class SPZConverter:
     """Main converter class that handles the Java tool execution."""
     
-    def __init__(self, project_root: Optional[str] = None):
+    def __init__(self, project_root: Optional[str] = None,
+                 on_log: Callable[[str], None] = print):
         self.project_root = Path(project_root) if project_root else Path(__file__).parent
+        self._on_log = on_log
         self.java_main_class = "de.javagl.jspz.examples.SpzToTileset"
+        self.java_server_class = "de.javagl.jspz.examples.SpzToTilesetServer"
         self.maven_module = "jspz-main"
+        self.cache_dir = Path.home() / ".cache" / "jspz"
+        self._classpath: Optional[str] = None
+        self._classpath_failed = False
+        self._local = threading.local()
+        self._workers: List[subprocess.Popen] = []
+        self._processes: Set[subprocess.Popen] = set()
+        self._workers_lock = threading.Lock()
+        self._terminated = False
+        # Serializes the Maven check and the classpath resolution, which
+        # may be triggered by several threads when they start their workers
+        self._setup_lock = threading.RLock()
+        
+        # Locate Maven and Java once, instead of searching the PATH for each conversion
+        java_home = os.environ.get("JAVA_HOME")
+        self._java_exe = (Path(java_home) / "bin" / ("java.exe" if os.name == "nt" else "java")
+                          if java_home else None)
+        self._mvn_candidates = self._maven_commands()
+        # The Maven command that passed the check, see _check_maven()
+        self._mvn_cmd: Optional[List[str]] = None
+    
+    def _maven_commands(self) -> List[Tuple[str, List[str]]]:
+        """
+        Build the candidate command prefixes for running Maven.
+        
+        When the Maven installation can be located (via MAVEN_HOME, M2_HOME
+        or the 'mvn' executable in the PATH), Maven's launcher is started
+        directly with Java. This skips the 'mvn' wrapper script, which
+        spawns an additional shell (cmd.exe on Windows) for each call.
+        The 'mvn' executable itself is the fallback, because the wrapper
+        script may set up more than the launcher command does (e.g. the
+        settings from .mvn/jvm.config, or the main class of Maven 4).
+        
+        Returns:
+            List of (description, command prefix) tuples, in the order in
+            which they should be tried. Empty if Maven was not found.
+        """
+        candidates = []
+        mvn_path = shutil.which("mvn.cmd" if os.name == "nt" else "mvn")
+        maven_home = os.environ.get("MAVEN_HOME") or os.environ.get("M2_HOME")
+        if maven_home:
+            maven_home = Path(maven_home)
+        elif mvn_path:
+            maven_home = Path(mvn_path).resolve().parent.parent
+        
+        if maven_home and self._java_exe is not None:
+            launcher_jars = sorted(glob.glob(str(maven_home / "boot" / "plexus-classworlds-*.jar")))
+            classworlds_conf = maven_home / "bin" / "m2.conf"
+            if launcher_jars and classworlds_conf.exists():
+                candidates.append((f"Maven launcher from {maven_home}", [
+                    str(self._java_exe),
+                    *os.environ.get("MAVEN_OPTS", "").split(),
+                    *MAVEN_STARTUP_OPTS.split(),
+                    "-classpath", launcher_jars[-1],
+                    f"-Dclassworlds.conf={classworlds_conf}",
+                    f"-Dmaven.home={maven_home}",
+                    f"-Dmaven.multiModuleProjectDirectory={os.path.abspath(self.project_root)}",
+                    "org.codehaus.plexus.classworlds.launcher.Launcher"
+                ]))
+        
+        if mvn_path:
+            candidates.append((f"Maven from {mvn_path}", [mvn_path]))
+        return candidates
+    
+    def _classes_dir(self) -> Path:
+        """Return the directory that contains the compiled classes of the Maven module."""
+        return self.project_root / self.maven_module / "target" / "classes"
+    
+    def _is_compiled(self, class_name: str) -> bool:
+        """Check whether the given class of the Maven module has been compiled."""
+        return (self._classes_dir() / (class_name.replace(".", "/") + ".class")).exists()
+    
+    def _resolve_classpath(self, log: Callable[[str], None]) -> Optional[str]:
+        """
+        Resolve the runtime classpath of the Maven module.
+        
+        The classpath is computed once with Maven and cached in
+        ~/.cache/jspz/classpath-<hash>.txt, where the hash is the SHA-256 of
+        the POM files, so it is recomputed when the dependencies change. It
+        is also recomputed when one of the cached entries no longer exists.
+        When the classpath could not be resolved, this is remembered, and
+        None is returned for all further calls.
+        
+        Args:
+            log: Function that receives the log messages
+            
+        Returns:
+            The classpath string, or None if it could not be resolved
+        """
+        if self._classpath is not None or self._classpath_failed:
+            return self._classpath
+        
+        with self._setup_lock:
+            if self._classpath is None and not self._classpath_failed:
+                self._classpath = self._resolve_classpath_locked(log)
+                # Do not run Maven again for each conversion when it failed once
+                self._classpath_failed = self._classpath is None
+            return self._classpath
+    
+    def _resolve_classpath_locked(self, log: Callable[[str], None]) -> Optional[str]:
+        """
+        Perform the classpath resolution of _resolve_classpath(), while
+        holding the setup lock.
+        
+        Args:
+            log: Function that receives the log messages
+            
+        Returns:
+            The classpath string, or None if it could not be resolved
+        """
+        # The root POM and the POMs of all modules (e.g. the dependencies of
+        # the 'jspz' module are dependencies of 'jspz-main' as well)
+        sha256 = hashlib.sha256()
+        for pom in [self.project_root / "pom.xml", *sorted(self.project_root.glob("*/pom.xml"))]:
+            if pom.exists():
+                sha256.update(pom.read_bytes())
+        cache_file = self.cache_dir / f"classpath-{sha256.hexdigest()}.txt"
+        
+        dependencies = None
+        try:
+            if cache_file.exists():
+                dependencies = cache_file.read_text(encoding="utf-8").strip()
+                if not dependencies or not all(Path(entry).exists()
+                                               for entry in dependencies.split(os.pathsep) if entry):
+                    dependencies = None
+        except OSError:
+            # An unreadable cache file is treated like a missing one
+            dependencies = None
+        
+        if dependencies is None:
+            maven_ok, maven_error = self._check_maven(log)
+            if not maven_ok:
+                log(f"✗ Could not resolve classpath: {maven_error}")
+                return None
+            
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                fd, output_name = tempfile.mkstemp(prefix="classpath-", suffix=".tmp", dir=self.cache_dir)
+                os.close(fd)
+            except OSError as e:
+                log(f"✗ Could not resolve classpath: {e}")
+                return None
+            output_file = Path(output_name)
+            cmd = [
+                *self._mvn_cmd, "-q", "-pl", self.maven_module, "-am",
+                "dependency:build-classpath",
+                f"-Dmdep.outputFile={output_file}"
+            ]
+            error = None
+            try:
+                result = subprocess.run(cmd, cwd=self.project_root, env=_maven_env(),
+                                      capture_output=True, text=True, timeout=300)
+                dependencies = output_file.read_text(encoding="utf-8").strip()
+                if result.returncode != 0 or not dependencies:
+                    error = f"{result.stdout}{result.stderr}"
+                else:
+                    output_file.replace(cache_file)
+            except Exception as e:
+                error = str(e)
+            if error is not None:
+                try:
+                    output_file.unlink()
+                except OSError:
+                    pass
+                log(f"✗ Could not resolve classpath: {error}")
+                return None
+        
+        # The module's own classes are not part of the dependency classpath
+        return os.pathsep.join(
+            entry for entry in (str(self._classes_dir()), dependencies) if entry)
+    
+    def _worker_command(self, log: Callable[[str], None]) -> Optional[List[str]]:
+        """
+        Build the command that starts a Java worker process.
+        
+        Args:
+            log: Function that receives the log messages
+            
+        Returns:
+            The command, or None if the worker cannot be started
+        """
+        java_ok, java_error = self._check_java()
+        if not java_ok:
+            log(f"✗ Prerequisites check failed: {java_error}")
+            return None
+        
+        if not self._is_compiled(self.java_server_class):
+            log(f"✗ {self.java_server_class} is not compiled. Please run 'mvn clean install' first.")
+            return None
+        
+        classpath = self._resolve_classpath(log)
+        if classpath is None:
+            return None
+        
+        return [str(self._java_exe), "-cp", classpath, self.java_server_class]
+    
+    @property
+    def _worker(self) -> Optional[subprocess.Popen]:
+        """The running worker process of the calling thread, if any."""
+        worker = getattr(self._local, "worker", None)
+        if worker is not None and worker.poll() is None:
+            return worker
+        return None
+    
+    def worker_available(self) -> bool:
+        """
+        Check whether the Java worker class is compiled, so that
+        start_worker() can be used.
+        
+        Returns:
+            True if a worker can be started, False otherwise
+        """
+        return self._is_compiled(self.java_server_class)
+    
+    def start_worker(self, log: Optional[Callable[[str], None]] = None) -> bool:
+        """
+        Start a persistent Java worker process that performs the conversions.
+        
+        While the worker is running, convert() sends jobs to it instead of
+        starting Maven for each file. Each thread gets its own worker, so
+        that several threads can convert files in parallel. The project has
+        to be built with 'mvn clean install' beforehand.
+        
+        Args:
+            log: Function that receives the log messages (default: the
+                on_log function of this converter)
+            
+        Returns:
+            True if the worker is running, False otherwise
+        """
+        if self._worker is not None:
+            return True
+        if self._terminated:
+            return False
+        
+        log = log or self._on_log
+        cmd = self._worker_command(log)
+        if cmd is None:
+            return False
+        
+        try:
+            worker = subprocess.Popen(
+                cmd, cwd=self.project_root, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE, text=True, encoding="utf-8", errors="replace", bufsize=1)
+        except Exception as e:
+            log(f"✗ Could not start worker: {e}")
+            return False
+        # Forward the messages of the Java tool (e.g. stack traces) to the log
+        threading.Thread(target=_forward_lines, args=(worker.stderr, log), daemon=True).start()
+        self._local.worker = worker
+        with self._workers_lock:
+            self._workers.append(worker)
+            if self._terminated:
+                worker.kill()
+        return True
+    
+    def _close_worker(self, worker: subprocess.Popen):
+        """Close the input of the given worker and wait for it to terminate."""
+        try:
+            worker.stdin.close()
+            worker.wait(timeout=10)
+        except Exception:
+            worker.kill()
+    
+    def _discard_worker(self):
+        """Stop the worker process of the calling thread."""
+        worker = getattr(self._local, "worker", None)
+        self._local.worker = None
+        if worker is None:
+            return
+        with self._workers_lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        self._close_worker(worker)
+    
+    def stop_worker(self):
+        """Stop all persistent Java worker processes that are running."""
+        with self._workers_lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            self._close_worker(worker)
+    
+    def terminate(self):
+        """
+        Kill all worker processes and all running conversions, without
+        waiting for them. No new workers are started afterwards.
+        """
+        with self._workers_lock:
+            self._terminated = True
+            processes = self._workers + list(self._processes)
+            self._workers = []
+        for proc in processes:
+            proc.kill()
+    
+    def _convert_with_worker(self, abs_input: str, abs_output: str, content_filename: str,
+                             timeout: float, log: Callable[[str], None]) -> bool:
+        """
+        Send a single conversion job to the persistent worker.
+        
+        If the worker does not answer within the timeout, it is killed.
+        
+        Returns:
+            True if the worker reported success, False otherwise
+        """
+        worker = self._worker
+        timed_out = threading.Event()
+        
+        def kill_worker():
+            timed_out.set()
+            worker.kill()
+        
+        timer = threading.Timer(timeout, kill_worker)
+        timer.start()
+        try:
+            worker.stdin.write(f"{abs_input}\t{abs_output}\t{content_filename}\n")
+            worker.stdin.flush()
+            status = worker.stdout.readline().strip()
+        except Exception as e:
+            status = f"ERR {e}"
+        finally:
+            timer.cancel()
+        
+        if timed_out.is_set():
+            self._discard_worker()
+            status = f"ERR Conversion timed out after {timeout:.0f} seconds"
+        elif not status:
+            # The worker terminated unexpectedly
+            self._discard_worker()
+            status = "ERR Worker process terminated"
+        
+        error = _parse_status(status)
+        if error is None:
+            return True
+        log(f"✗ Conversion failed!")
+        log(f"Error output: {error}")
+        return False
+    
+    def _check_input(self, input_file: str, log: Callable[[str], None]) -> bool:
+        """
+        Check that the input file exists and is an SPZ file.
+        
+        Returns:
+            True if the input file is valid, False otherwise
+        """
+        if not Path(input_file).exists():
+            log(f"✗ Input file '{input_file}' does not exist")
+            return False
+        if Path(input_file).suffix.lower() != ".spz":
+            log(f"✗ Input file '{input_file}' is not an SPZ file")
+            return False
+        return True
+    
+    def _is_up_to_date(self, input_file: str, output_dir: str, content_filename: str) -> bool:
+        """
+        Check whether the output files exist and are newer than the input file.
+        """
+        input_mtime = os.path.getmtime(input_file)
+        for output_file in (Path(output_dir) / "tileset.json", Path(output_dir) / content_filename):
+            try:
+                if output_file.stat().st_mtime < input_mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+    
+    def _prepare_job(self, input_file: str, output_dir: str, content_filename: str,
+                     force: bool, log: Callable[[str], None]) -> Optional[bool]:
+        """
+        Validate the input of a conversion job and create its output directory.
+        
+        Returns:
+            None if the file has to be converted, or the result of the job if
+            it is already finished: False if the input is invalid, and True if
+            the output is up to date
+        """
+        if not self._check_input(input_file, log):
+            return False
+        
+        # The worker protocol separates the jobs by line breaks, and the
+        # paths of a job by tabs, so these must not appear in the paths
+        if any(c in path for path in (os.path.abspath(input_file), os.path.abspath(output_dir),
+                                      content_filename) for c in "\t\r\n"):
+            log(f"✗ Paths with tabs or line breaks are not supported: {input_file!r}")
+            return False
+        
+        if not force and self._is_up_to_date(input_file, output_dir, content_filename):
+            log(f"✓ Output in {output_dir} is up to date, skipping {input_file}")
+            return True
+        
+        # Create output directory if it doesn't exist
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        return None
     
     def check_prerequisites(self) -> Tuple[bool, str]:
         """
@@ -35,33 +526,71 @@ class SPZConverter:
         Returns:
             Tuple of (success, error_message)
         """
-        # Check if Maven is available
-        mvn_cmd = "mvn.cmd" if os.name == "nt" else "mvn"
-        if not shutil.which(mvn_cmd):
-            return False, "Maven not found in PATH. Please install Maven and add it to PATH."
+        java_ok, java_error = self._check_java()
+        if not java_ok:
+            return False, java_error
         
+        # The check itself does not log which Maven command will be used
+        return self._check_maven(log=lambda message: None)
+    
+    def _check_java(self) -> Tuple[bool, str]:
+        """
+        Check if Java is properly installed and configured.
+        
+        This is all that is needed to run the compiled Java tool directly.
+        
+        Returns:
+            Tuple of (success, error_message)
+        """
         # Check if JAVA_HOME is set
-        java_home = os.environ.get("JAVA_HOME")
-        if not java_home:
+        if not self._java_exe:
             return False, "JAVA_HOME environment variable is not set. Please set JAVA_HOME to your JDK installation."
         
         # Check if Java is available
-        java_exe = Path(java_home) / "bin" / ("java.exe" if os.name == "nt" else "java")
-        if not java_exe.exists():
-            return False, f"Java executable not found at {java_exe}. Please check JAVA_HOME setting."
-        
-        # Test Maven with a simple command
-        try:
-            result = subprocess.run([mvn_cmd, "--version"], 
-                                  capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
-                return False, f"Maven test failed: {result.stderr}"
-        except Exception as e:
-            return False, f"Maven test failed: {e}"
+        if not self._java_exe.exists():
+            return False, f"Java executable not found at {self._java_exe}. Please check JAVA_HOME setting."
         
         return True, ""
     
-    def convert(self, input_file: str, output_dir: str, content_filename: str = "content.glb") -> bool:
+    def _check_maven(self, log: Optional[Callable[[str], None]] = None) -> Tuple[bool, str]:
+        """
+        Check if Maven is properly installed and configured.
+        
+        This is only called right before Maven is actually needed. The
+        first candidate command that passes the check is used for all
+        further Maven calls.
+        
+        Args:
+            log: Function that receives the log messages (default: the on_log
+                function of this converter)
+            
+        Returns:
+            Tuple of (success, error_message)
+        """
+        if self._mvn_cmd is not None:
+            return True, ""
+        
+        # Check if Maven is available
+        if not self._mvn_candidates:
+            return False, "Maven not found in PATH. Please install Maven and add it to PATH."
+        
+        with self._setup_lock:
+            if self._mvn_cmd is not None:
+                return True, ""
+            
+            # Test Maven with a simple command (the result is cached)
+            maven_error = ""
+            for description, mvn_cmd in self._mvn_candidates:
+                maven_ok, maven_error = _test_maven(tuple(mvn_cmd))
+                if maven_ok:
+                    (log or self._on_log)(f"Using {description}")
+                    self._mvn_cmd = mvn_cmd
+                    return True, ""
+            return False, maven_error
+    
+    def convert(self, input_file: str, output_dir: str, content_filename: str = "content.glb",
+                timeout: Optional[float] = None, force: bool = False,
+                log: Optional[Callable[[str], None]] = None) -> bool:
         """
         Convert SPZ file to glTF tileset.
         
@@ -69,79 +598,265 @@ class SPZConverter:
             input_file: Path to input SPZ file
             output_dir: Output directory for generated files
             content_filename: Name for the GLB content file
+            timeout: Timeout in seconds (default: 2 seconds per MiB of input, at least 5 minutes)
+            force: Convert even if the output files are newer than the input file
+            log: Function that receives the log messages, including the output
+                of Maven (default: the on_log function of this converter)
             
         Returns:
             True if conversion succeeded, False otherwise
         """
-        # Check prerequisites first
-        prereq_ok, prereq_error = self.check_prerequisites()
-        if not prereq_ok:
-            print(f"✗ Prerequisites check failed: {prereq_error}")
-            return False
+        log = log or self._on_log
         
-        # Validate inputs
-        if not Path(input_file).exists():
-            print(f"✗ Input file '{input_file}' does not exist")
-            return False
+        # Validate inputs before anything that has to start a JVM
+        result = self._prepare_job(input_file, output_dir, content_filename, force, log)
+        if result is not None:
+            return result
         
-        # Create output directory if it doesn't exist
-        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        # Check Java (a running worker has already been checked). Maven is only
+        # checked when it is actually needed.
+        if self._worker is None:
+            java_ok, java_error = self._check_java()
+            if not java_ok:
+                log(f"✗ Prerequisites check failed: {java_error}")
+                return False
         
-        # Use correct Maven command for Windows/Unix
-        mvn_cmd = "mvn.cmd" if os.name == "nt" else "mvn"
+        if timeout is None:
+            timeout = _default_timeout(input_file)
         
-        # Convert paths to absolute paths and handle Windows paths properly
-        abs_input = str(Path(input_file).resolve())
-        abs_output = str(Path(output_dir).resolve())
+        # Convert paths to absolute paths (the existence was already checked)
+        abs_input = os.path.abspath(input_file)
+        abs_output = os.path.abspath(output_dir)
         
-        # Build Maven command
-        cmd = [
-            mvn_cmd, "exec:java",
-            f"-Dexec.mainClass={self.java_main_class}",
-            f"-Dexec.args={abs_input} {abs_output} {content_filename}",
-            "-pl", self.maven_module,
-            "-q"  # Quiet mode
-        ]
+        if self._worker is not None:
+            log(f"Converting {input_file} to {output_dir}...")
+            if not self._convert_with_worker(abs_input, abs_output, content_filename, timeout, log):
+                return False
+            log(f"✓ Conversion completed successfully!")
+            log(f"  Output files:")
+            log(f"    - {Path(output_dir) / 'tileset.json'}")
+            log(f"    - {Path(output_dir) / content_filename}")
+            return True
+        
+        # Run the Java tool directly with the cached classpath, and only fall
+        # back to Maven when the classpath is not available
+        classpath = self._resolve_classpath(log) if self._is_compiled(self.java_main_class) else None
+        if classpath is not None:
+            cmd = [
+                str(self._java_exe), "-cp", classpath, self.java_main_class,
+                abs_input, abs_output, content_filename
+            ]
+        else:
+            maven_ok, maven_error = self._check_maven(log)
+            if not maven_ok:
+                log(f"✗ Prerequisites check failed: {maven_error}")
+                return False
+            
+            # Build Maven command
+            cmd = [
+                *self._mvn_cmd, "exec:java",
+                f"-Dexec.mainClass={self.java_main_class}",
+                # Maven splits exec.arguments at commas (not at spaces), so that
+                # paths with spaces are passed as single arguments
+                "-Dexec.arguments=" + ",".join(arg.replace(",", "\\,")
+                                               for arg in (abs_input, abs_output, content_filename)),
+                "-pl", self.maven_module,
+                "-q"  # Quiet mode
+            ]
         
         try:
-            print(f"Converting {input_file} to {output_dir}...")
-            print(f"Running: {' '.join(cmd)}")
+            log(f"Converting {input_file} to {output_dir}...")
+            log(f"Running: {' '.join(cmd)}")
+            
+            # Forward the output line by line instead of buffering all of it
+            proc = subprocess.Popen(cmd, cwd=self.project_root, env=_maven_env(),
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    text=True, errors="replace", bufsize=1)
+            with self._workers_lock:
+                self._processes.add(proc)
+                if self._terminated:
+                    proc.kill()
+            timed_out = threading.Event()
+            
+            def kill_proc():
+                timed_out.set()
+                proc.kill()
+            
+            timer = threading.Timer(timeout, kill_proc)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    log(line.rstrip("\n"))
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                # Do not leave the process running when forwarding the output failed
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+                with self._workers_lock:
+                    self._processes.discard(proc)
             
-            result = subprocess.run(cmd, cwd=self.project_root, 
-                                  capture_output=True, text=True, timeout=300)
+            if timed_out.is_set():
+                log(f"✗ Conversion timed out after {timeout:.0f} seconds")
+                return False
             
-            if result.returncode == 0:
-                print(f"✓ Conversion completed successfully!")
-                print(f"  Output files:")
-                print(f"    - {Path(output_dir) / 'tileset.json'}")
-                print(f"    - {Path(output_dir) / content_filename}")
+            if returncode == 0:
+                log(f"✓ Conversion completed successfully!")
+                log(f"  Output files:")
+                log(f"    - {Path(output_dir) / 'tileset.json'}")
+                log(f"    - {Path(output_dir) / content_filename}")
                 return True
             else:
-                print(f"✗ Conversion failed!")
-                print(f"Return code: {result.returncode}")
-                if result.stdout:
-                    print(f"Standard output: {result.stdout}")
-                if result.stderr:
-                    print(f"Error output: {result.stderr}")
+                log(f"✗ Conversion failed!")
+                log(f"Return code: {returncode}")
                 return False
                 
-        except subprocess.TimeoutExpired:
-            print("✗ Conversion timed out after 5 minutes")
-            return False
         except FileNotFoundError as e:
-            print(f"✗ Command not found: {e}")
+            log(f"✗ Command not found: {e}")
             return False
         except Exception as e:
-            print(f"✗ Unexpected error: {e}")
+            log(f"✗ Unexpected error: {e}")
             return False
+    
+    async def convert_many(self, jobs: Sequence[Tuple[str, str, str]],
+                           concurrency: Optional[int] = None,
+                           timeout: Optional[float] = None,
+                           force: bool = False,
+                           log: Optional[Callable[[str], None]] = None) -> List[bool]:
+        """
+        Convert many SPZ files with a pool of persistent Java workers.
+        
+        A worker that does not finish a job within the timeout is killed
+        and replaced by a new worker process.
+        
+        Args:
+            jobs: Sequence of (input_file, output_dir, content_filename) tuples
+            concurrency: Number of worker processes, at least 1 (default: number of CPUs)
+            timeout: Timeout in seconds for each job (default: 2 seconds per MiB
+                of input, at least 5 minutes)
+            force: Convert even if the output files are newer than the input files
+            log: Function that receives the log messages (default: the on_log
+                function of this converter)
+            
+        Returns:
+            List with one success flag for each job, in the order of the jobs
+        """
+        if concurrency is not None and concurrency < 1:
+            raise ValueError(f"The concurrency must be at least 1, but is {concurrency}")
+        
+        log = log or self._on_log
+        results = [False] * len(jobs)
+        if not jobs:
+            return results
+        
+        num_workers = min(concurrency or os.cpu_count() or 1, len(jobs))
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, job in enumerate(jobs):
+            queue.put_nowait((index, job))
+        
+        loop = asyncio.get_running_loop()
+        
+        def preflight(input_file: str, output_dir: str, content_filename: str):
+            # Runs in an executor, so that file system access (which may be slow,
+            # e.g. on network drives) does not block the event loop
+            try:
+                result = self._prepare_job(input_file, output_dir, content_filename, force, log)
+            except OSError as e:
+                # Only this job fails, the other jobs keep running
+                log(f"✗ {input_file}: {e}")
+                return False, "", "", 0.0
+            if result is not None:
+                return result, "", "", 0.0
+            job_timeout = timeout if timeout is not None else _default_timeout(input_file)
+            return None, os.path.abspath(input_file), os.path.abspath(output_dir), job_timeout
+        
+        forwarders = []
+        
+        # The worker command is only built for the first job that actually has
+        # to be converted, so that a batch of up-to-date files starts no JVM
+        worker_cmd: List[Optional[List[str]]] = []
+        worker_cmd_lock = asyncio.Lock()
+        
+        async def get_worker_cmd() -> Optional[List[str]]:
+            async with worker_cmd_lock:
+                if not worker_cmd:
+                    worker_cmd.append(await loop.run_in_executor(None, self._worker_command, log))
+            return worker_cmd[0]
+        
+        async def forward_stderr(stream: asyncio.StreamReader):
+            # Forward the messages of the Java tool (e.g. stack traces) to the log
+            while True:
+                line = await stream.readline()
+                if not line:
+                    return
+                log(line.decode("utf-8", errors="replace").rstrip())
+        
+        async def run_worker():
+            proc = None
+            try:
+                while not queue.empty():
+                    index, (input_file, output_dir, content_filename) = queue.get_nowait()
+                    result, abs_input, abs_output, job_timeout = await loop.run_in_executor(
+                        None, preflight, input_file, output_dir, content_filename)
+                    if result is not None:
+                        results[index] = result
+                        continue
+                    
+                    cmd = await get_worker_cmd()
+                    if cmd is None:
+                        log(f"✗ {input_file}: The worker could not be started")
+                        continue
+                    
+                    line = f"{abs_input}\t{abs_output}\t{content_filename}\n"
+                    try:
+                        if proc is None:
+                            proc = await asyncio.create_subprocess_exec(
+                                *cmd, cwd=self.project_root, stdin=asyncio.subprocess.PIPE,
+                                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+                            forwarders.append(asyncio.ensure_future(forward_stderr(proc.stderr)))
+                        proc.stdin.write(line.encode("utf-8"))
+                        await proc.stdin.drain()
+                        status = await asyncio.wait_for(proc.stdout.readline(), job_timeout)
+                        status = status.decode("utf-8").strip()
+                    except OSError as e:
+                        # The worker could not be started, or terminated between jobs
+                        status = "" if proc is not None else f"ERR Could not start worker: {e}"
+                    except asyncio.TimeoutError:
+                        status = f"ERR Conversion timed out after {job_timeout:.0f} seconds"
+                        proc.kill()
+                        await proc.wait()
+                        proc = None
+                    if not status:
+                        status = "ERR Worker process terminated"
+                        if proc is not None:
+                            if proc.returncode is None:
+                                proc.kill()
+                            await proc.wait()
+                            proc = None
+                    error = _parse_status(status)
+                    if error is None:
+                        log(f"✓ {input_file} -> {Path(output_dir) / content_filename}")
+                        results[index] = True
+                    else:
+                        log(f"✗ {input_file}: {error}")
+            finally:
+                if proc is not None and proc.returncode is None:
+                    proc.stdin.close()
+                    await proc.wait()
+        
+        await asyncio.gather(*(run_worker() for _ in range(num_workers)))
+        await asyncio.gather(*forwarders)
+        return results
 
 
 class SPZConverterGUI:
     """GUI interface for the SPZ converter."""
     
     def __init__(self):
-        self.converter = SPZConverter()
         self.root = tk.Tk()
+        self.converter = SPZConverter()
         self.root.title("SPZ to glTF Converter")
         self.root.geometry("600x400")
         
@@ -149,8 +864,16 @@ class SPZConverterGUI:
         self.input_file = tk.StringVar()
         self.output_dir = tk.StringVar()
         self.content_filename = tk.StringVar(value="content.glb")
+        self.timeout = tk.StringVar(value="0")
+        
+        # Conversions run on a persistent pool, each thread with its own Java worker
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
+        self._closing = False
+        self._batch_remaining = 0
+        self._batch_failed = 0
         
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
     
     def create_widgets(self):
         """Create the GUI widgets."""
@@ -178,8 +901,18 @@ class SPZConverterGUI:
         ttk.Label(main_frame, text="Content Filename:").grid(row=4, column=0, sticky=tk.W, pady=(0, 5))
         ttk.Entry(main_frame, textvariable=self.content_filename, width=30).grid(row=5, column=0, sticky=tk.W, pady=(0, 20))
         
-        # Convert button
-        ttk.Button(main_frame, text="Convert", command=self.convert).grid(row=6, column=0, pady=(0, 20))
+        # Timeout
+        ttk.Label(main_frame, text="Timeout (seconds, 0 = automatic):").grid(row=4, column=1, sticky=tk.W, pady=(0, 5))
+        ttk.Spinbox(main_frame, textvariable=self.timeout, from_=0, to=86400, increment=60,
+                    width=10).grid(row=5, column=1, sticky=tk.W, pady=(0, 20))
+        
+        # Convert buttons
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=6, column=0, pady=(0, 20))
+        self.convert_button = ttk.Button(button_frame, text="Convert", command=self.convert)
+        self.convert_button.grid(row=0, column=0)
+        self.batch_button = ttk.Button(button_frame, text="Batch…", command=self.convert_batch)
+        self.batch_button.grid(row=0, column=1, padx=(10, 0))
         
         # Log area
         ttk.Label(main_frame, text="Log:").grid(row=7, column=0, sticky=tk.W, pady=(0, 5))
@@ -216,11 +949,38 @@ class SPZConverterGUI:
         if dirname:
             self.output_dir.set(dirname)
     
+    def get_timeout(self) -> Optional[float]:
+        """Return the timeout from the spinbox, or None for the automatic timeout."""
+        try:
+            timeout = float(self.timeout.get())
+        except ValueError:
+            return None
+        return timeout if timeout > 0 else None
+    
+    def _post(self, func: Callable, *args):
+        """Call the given function on the Tk thread. May be called from any thread."""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, func, *args)
+        except (tk.TclError, RuntimeError):
+            # The window was closed in the meantime
+            pass
+    
     def log(self, message: str):
-        """Add message to log area."""
+        """Add message to log area. May be called from any thread."""
+        self._post(self._append_log, message)
+    
+    def _append_log(self, message: str):
+        """Append message to the log area. Must be called on the Tk thread."""
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
-        self.root.update()
+    
+    def _set_busy(self, busy: bool):
+        """Disable or enable the convert buttons."""
+        state = tk.DISABLED if busy else tk.NORMAL
+        self.convert_button.configure(state=state)
+        self.batch_button.configure(state=state)
     
     def convert(self):
         """Run the conversion."""
@@ -243,22 +1003,111 @@ class SPZConverterGUI:
         # Clear log
         self.log_text.delete(1.0, tk.END)
         
-        # Redirect print to log
-        import io
-        import contextlib
-        
-        log_stream = io.StringIO()
-        with contextlib.redirect_stdout(log_stream):
-            success = self.converter.convert(input_file, output_dir, content_filename)
-        
-        # Display log output
-        self.log(log_stream.getvalue())
-        
+        # Run the conversion in the background, so that the window stays responsive
+        self._set_busy(True)
+        self._pool.submit(self._do_convert, input_file, output_dir, content_filename,
+                          self.get_timeout())
+    
+    def _do_convert(self, input_file: str, output_dir: str, content_filename: str,
+                    timeout: Optional[float]):
+        """Run the conversion. Called on a pool thread."""
+        success = False
+        try:
+            self._start_worker()
+            success = self.converter.convert(input_file, output_dir, content_filename,
+                                             timeout=timeout, force=True, log=self.log)
+        except Exception as e:
+            self.log(f"✗ Conversion failed: {e}")
+        finally:
+            # Always re-enable the GUI, even if the conversion raised
+            self._post(self._convert_finished, success)
+    
+    def _start_worker(self):
+        """
+        Start the Java worker of the current pool thread. Without a compiled
+        worker class, convert() falls back to running the tool for each file,
+        so this is not reported as an error.
+        """
+        if self.converter.worker_available():
+            self.converter.start_worker(log=self.log)
+    
+    def _convert_finished(self, success: bool):
+        """Re-enable the GUI and report the result of a conversion."""
+        self._set_busy(False)
         if success:
             messagebox.showinfo("Success", "Conversion completed successfully!")
         else:
             messagebox.showerror("Error", "Conversion failed. Check the log for details.")
     
+    def convert_batch(self):
+        """Convert all SPZ files in a directory."""
+        output_dir = self.output_dir.get().strip()
+        content_filename = self.content_filename.get().strip() or "content.glb"
+        
+        if not output_dir:
+            messagebox.showerror("Error", "Please select an output directory")
+            return
+        
+        input_dir = filedialog.askdirectory(title="Select directory with SPZ files")
+        if not input_dir:
+            return
+        
+        input_files = _spz_files(Path(input_dir).rglob("*"))
+        if not input_files:
+            messagebox.showerror("Error", f"No SPZ files found in {input_dir}")
+            return
+        jobs = _batch_jobs(input_files, Path(input_dir), output_dir, content_filename)
+        
+        # Clear log
+        self.log_text.delete(1.0, tk.END)
+        
+        self._set_busy(True)
+        self._batch_remaining = len(jobs)
+        self._batch_failed = 0
+        timeout = self.get_timeout()
+        for input_file, job_output_dir, job_content_filename in jobs:
+            future = self._pool.submit(self._convert_job, input_file, job_output_dir,
+                                       job_content_filename, timeout)
+            future.add_done_callback(
+                lambda f, name=input_file: self._post(self._batch_job_finished, name, f))
+    
+    def _convert_job(self, input_file: str, output_dir: str, content_filename: str,
+                     timeout: Optional[float]) -> bool:
+        """Convert a single file of a batch. Called on a pool thread."""
+        if self._closing:
+            return False
+        self._start_worker()
+        return self.converter.convert(input_file, output_dir, content_filename,
+                                      timeout=timeout, log=self.log)
+    
+    def _batch_job_finished(self, input_file: str, future: concurrent.futures.Future):
+        """Log the result of a batch job, and report when the batch is complete."""
+        try:
+            success = future.result()
+        except Exception as e:
+            self._append_log(f"✗ {input_file}: {e}")
+            success = False
+        else:
+            self._append_log(f"{'✓' if success else '✗'} {input_file}")
+        if not success:
+            self._batch_failed += 1
+        
+        self._batch_remaining -= 1
+        if self._batch_remaining > 0:
+            return
+        self._set_busy(False)
+        if self._batch_failed == 0:
+            messagebox.showinfo("Success", "All files were converted successfully!")
+        else:
+            messagebox.showerror("Error", f"{self._batch_failed} conversions failed. Check the log for details.")
+    
+    def close(self):
+        """Stop the conversions and the worker processes, and close the window."""
+        self._closing = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.converter.terminate()
+        self.root.destroy()
+    
     def run(self):
         """Start the GUI."""
         self.root.mainloop()
@@ -268,14 +1117,25 @@ def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Convert SPZ files to glTF tilesets for Cesium")
     parser.add_argument("--gui", action="store_true", help="Launch GUI interface")
-    parser.add_argument("input_file", nargs="?", help="Input SPZ file")
+    parser.add_argument("input_file", nargs="?",
+                       help="Input SPZ file, a directory that is searched recursively for SPZ files, or a glob pattern")
     parser.add_argument("output_dir", nargs="?", help="Output directory")
     parser.add_argument("--content-name", default="content.glb", 
                        help="Name for the GLB content file (default: content.glb)")
     parser.add_argument("--project-root", help="Path to the Java project root directory")
+    parser.add_argument("--concurrency", type=_positive_int, default=os.cpu_count(),
+                       help="Number of parallel conversions for multiple inputs (default: number of CPUs)")
+    parser.add_argument("--force", action="store_true",
+                       help="Convert even if the output files are newer than the input file")
+    parser.add_argument("--timeout", type=float,
+                       help="Timeout in seconds for each conversion, 0 = automatic (default: 2 seconds per MiB of input, at least 300)")
     
     args = parser.parse_args()
     
+    # Like in the GUI, a timeout of 0 selects the automatic timeout
+    if args.timeout is not None and args.timeout <= 0:
+        args.timeout = None
+    
     # GUI mode
     if args.gui:
         if not GUI_AVAILABLE:
@@ -292,7 +1152,33 @@ def main():
         sys.exit(1)
     
     converter = SPZConverter(args.project_root)
-    success = converter.convert(args.input_file, args.output_dir, args.content_name)
+    
+    # Directory or glob pattern: convert all matching files in parallel, mirroring
+    # the directory structure of the inputs in the output directory
+    input_path = Path(args.input_file)
+    input_files = None
+    if input_path.is_dir():
+        input_files = _spz_files(input_path.rglob("*"))
+        base_dir = input_path
+    elif not input_path.exists() and any(c in args.input_file for c in "*?["):
+        input_files = _spz_files(Path(f) for f in glob.glob(args.input_file, recursive=True))
+        base_dir = Path(os.path.commonpath([f.parent for f in input_files])) if input_files else None
+    
+    if input_files is not None:
+        if not input_files:
+            print(f"✗ No SPZ files found for '{args.input_file}'")
+            sys.exit(1)
+        jobs = _batch_jobs(input_files, base_dir, args.output_dir, args.content_name)
+        start_time = time.monotonic()
+        results = asyncio.run(converter.convert_many(jobs, concurrency=args.concurrency,
+                                                     timeout=args.timeout, force=args.force))
+        elapsed = time.monotonic() - start_time
+        print(f"Converted {results.count(True)} of {len(results)} files "
+              f"({results.count(False)} failed) in {elapsed:.1f} seconds")
+        sys.exit(0 if all(results) else 1)
+    
+    success = converter.convert(args.input_file, args.output_dir, args.content_name,
+                                timeout=args.timeout, force=args.force)
     sys.exit(0 if success else 1)
 
 